@@ -6,25 +6,42 @@ This script provides a simple command-line interface to the Kokoro TTS system.
 It handles text input, generates speech using the Kokoro ONNX model, and outputs
 a WAV file.
 
+It can also run as a persistent worker (--serve) that loads the model once and
+then reads newline-delimited JSON requests from stdin, writing one JSON response
+per line to stdout. This avoids paying the model load cost on every utterance.
+
 Usage:
     python kokoro_runner.py --text "Your text here" --output output.wav [options]
+    python kokoro_runner.py --serve [--model ...] [--voices ...]
+
+Worker protocol (one JSON object per line):
+    request:  {"id": 1, "text": "...", "output": "/tmp/out.wav",
+               "voice": "af_sarah", "speed": 1.0, "lang": "en-us"}
+    response: {"id": 1, "ok": true, "output": "/tmp/out.wav", "duration": 1.23}
+              {"id": 1, "ok": false, "error": "..."}
 """
 
 import argparse
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.metadata
+import json
+import multiprocessing
+import re
+import sqlite3
+import struct
 import sys
 import os
 import traceback
+import zipfile
 from pathlib import Path
 
-# Import Kokoro components
-try:
-    from kokoro_onnx import Kokoro
-    import soundfile as sf
-except ImportError as e:
-    print(f"Error: Required dependency not found: {e}", file=sys.stderr)
-    print("Please install required packages:", file=sys.stderr)
-    print("  pip install kokoro-onnx soundfile numpy", file=sys.stderr)
-    sys.exit(1)
+# Kokoro components, imported by import_dependencies() once arguments are valid
+Kokoro = None
+sf = None
+np = None
 
 # Configuration constants
 DEFAULT_SPEED = 1.0
@@ -32,6 +49,36 @@ DEFAULT_LANGUAGE = "en-us"
 DEFAULT_VOICE = "af_sarah"
 DEFAULT_MODEL_PATH = "kokoro-v1.0.onnx"
 DEFAULT_VOICES_PATH = "voices-v1.0.bin"
+INT8_MODEL_SUFFIX = ".int8.onnx"
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+PARALLEL_TEXT_THRESHOLD = 1000
+
+PHONEME_CACHE_SIZE = 4096
+PHONEME_STATS_INTERVAL = 100
+DEFAULT_PHONEME_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "local-voice-mcp", "phonemes.sqlite"
+)
+
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Execution providers that have INT8 kernels for dynamically quantized models.
+# CUDA EP falls back to slow paths for these ops, so INT8 is only used on these.
+INT8_PROVIDERS = ("CPUExecutionProvider", "DmlExecutionProvider")
+
+
+def import_dependencies():
+    """Import Kokoro components on demand so --help and bad arguments stay fast."""
+    global Kokoro, sf, np
+    try:
+        from kokoro_onnx import Kokoro
+        import numpy as np
+        import soundfile as sf
+    except ImportError as e:
+        print(f"Error: Required dependency not found: {e}", file=sys.stderr)
+        print("Please install required packages:", file=sys.stderr)
+        print("  pip install kokoro-onnx soundfile numpy", file=sys.stderr)
+        sys.exit(1)
 
 
 def check_required_files(model_path, voices_path):
@@ -52,6 +99,544 @@ def check_required_files(model_path, voices_path):
         sys.exit(1)
 
 
+def int8_model_path(model_path):
+    """Return the INT8 sibling path for an FP32 model path."""
+    root, _ = os.path.splitext(model_path)
+    return root + INT8_MODEL_SUFFIX
+
+
+def session_providers():
+    """Return the ONNX Runtime execution providers to use, in preference order.
+
+    CPU is the default, as in kokoro-onnx. Accelerators such as CUDA, CoreML
+    or DirectML are opt-in via ONNX_PROVIDER, with CPU kept as a fallback for
+    ops the accelerator can't run.
+    """
+    env_provider = os.getenv("ONNX_PROVIDER")
+    if env_provider and env_provider != "CPUExecutionProvider":
+        return [env_provider, "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
+
+def active_provider():
+    """Return the ONNX Runtime execution provider Kokoro will use."""
+    return session_providers()[0]
+
+
+def create_session(model_path, intra_op_threads=None):
+    """Create an ONNX Runtime session with full graph optimization and tuned threads."""
+    import onnxruntime as ort
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    # Half the logical cores avoids oversubscribing hyperthreads and leaves
+    # room for the MCP server and audio playback.
+    sess_options.intra_op_num_threads = intra_op_threads or max(1, (os.cpu_count() or 2) // 2)
+
+    providers = session_providers()
+    print(f"[MAIN] Execution providers: {', '.join(providers)}", file=sys.stderr)
+    return ort.InferenceSession(model_path, sess_options, providers=providers)
+
+
+def resolve_model_path(model_path):
+    """Prefer the INT8 quantized model (see quantize_kokoro.py) when it is usable.
+
+    Falls back to the given FP32 model if no quantized copy exists or the active
+    execution provider lacks INT8 kernels.
+    """
+    if model_path.endswith(INT8_MODEL_SUFFIX):
+        return model_path
+    quantized = int8_model_path(model_path)
+    if not os.path.exists(quantized):
+        return model_path
+
+    provider = active_provider()
+    if provider not in INT8_PROVIDERS:
+        print(f"[MAIN] Warning: INT8 model found but {provider} has no INT8 kernels; "
+              f"using FP32 model", file=sys.stderr)
+        return model_path
+    return quantized
+
+
+def validate_request(text, speed):
+    """Validate synthesis parameters, returning an error message or None."""
+    if not isinstance(text, str) or not text.strip():
+        return "Text cannot be empty"
+    if speed < 0.5 or speed > 2.0:
+        return "Speed must be between 0.5 and 2.0"
+    return None
+
+
+def normalize_whitespace(text):
+    """Collapse runs of whitespace so equivalent texts share cache entries."""
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def split_sentences(text):
+    """Split text on sentence boundaries, dropping empty pieces."""
+    return [part for part in SENTENCE_SPLIT_RE.split(text) if part.strip()]
+
+
+def iterate_async(agen):
+    """Drive an async generator from synchronous code."""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.close()
+
+
+class PhonemeCache:
+    """Phonemization cache keyed by (kokoro-onnx version, lang, text hash).
+
+    Lookups go through an in-memory LRU first. With a path, a SQLite file
+    backs the LRU so results persist across invocations; the stored phonemes
+    spell out the original text, so that is opt-in. If the database cannot be
+    opened the cache keeps working in memory only.
+    """
+
+    def __init__(self, kokoro, path=None):
+        self.kokoro = kokoro
+        self.version = kokoro_version()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self._open_db(path)
+        self.phonemize = functools.lru_cache(maxsize=PHONEME_CACHE_SIZE)(self._phonemize)
+
+    def _open_db(self, path):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.db = sqlite3.connect(path)
+            # WAL with synchronous=NORMAL avoids an fsync on every stored miss;
+            # losing the last few rows in a crash only costs a re-phonemize
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS phonemes ("
+                "version TEXT, lang TEXT, text_sha256 TEXT, phonemes TEXT, "
+                "PRIMARY KEY (version, lang, text_sha256))"
+            )
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"[CACHE] Warning: phoneme cache disabled on disk ({e})", file=sys.stderr)
+            self.db = None
+
+    def _phonemize(self, text, lang):
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if self.db is not None:
+            row = self.db.execute(
+                "SELECT phonemes FROM phonemes "
+                "WHERE version = ? AND lang = ? AND text_sha256 = ?",
+                (self.version, lang, key),
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                return row[0]
+
+        self.misses += 1
+        phonemes = self.kokoro.tokenizer.phonemize(text, lang)
+        if self.db is not None:
+            try:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO phonemes VALUES (?, ?, ?, ?)",
+                    (self.version, lang, key, phonemes),
+                )
+                self.db.commit()
+            except sqlite3.Error as e:
+                print(f"[CACHE] Warning: failed to store phonemes ({e})", file=sys.stderr)
+        return phonemes
+
+    def lookup(self, text, lang):
+        """Return phonemes for text, logging the hit rate every PHONEME_STATS_INTERVAL lookups."""
+        before = self.phonemize.cache_info().hits
+        phonemes = self.phonemize(text, lang)
+        if self.phonemize.cache_info().hits > before:
+            self.hits += 1
+        total = self.hits + self.misses
+        if total % PHONEME_STATS_INTERVAL == 0:
+            print(f"[CACHE] Phoneme cache hit rate: {self.hits / total:.0%} ({self.hits}/{total})",
+                  file=sys.stderr)
+        return phonemes
+
+
+def kokoro_version():
+    """Return the installed kokoro-onnx version, used to key cached phonemes."""
+    try:
+        return importlib.metadata.version("kokoro-onnx")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# Kokoro instance owned by a SentencePool worker process
+_pool_kokoro = None
+
+
+def _init_pool_worker(model_path, voices_path, intra_op_threads):
+    """ProcessPoolExecutor initializer: load one Kokoro instance per worker."""
+    global _pool_kokoro
+    import_dependencies()
+    _pool_kokoro = load_kokoro(model_path, voices_path, intra_op_threads)
+
+
+def _synthesize_sentence(sentence, voice, speed, lang):
+    """Synthesize one sentence in a SentencePool worker process."""
+    return _pool_kokoro.create(text=sentence, voice=voice, speed=speed, lang=lang)
+
+
+class SentencePool:
+    """Synthesizes the sentences of long texts in parallel.
+
+    On the CPU provider each worker process loads its own Kokoro instance and
+    the cores are split between them. On GPU providers a thread pool shares
+    the already-loaded model so launches overlap. The executor is only
+    started the first time a long text comes in.
+    """
+
+    def __init__(self, kokoro, model_path, voices_path, workers):
+        self.kokoro = kokoro
+        self.model_path = model_path
+        self.voices_path = voices_path
+        self.workers = workers
+        self.executor = None
+        self.use_processes = active_provider() == "CPUExecutionProvider"
+
+    def _get_executor(self):
+        if self.executor is None:
+            print(f"[MAIN] Starting {self.workers} sentence workers", file=sys.stderr)
+            if self.use_processes:
+                threads = max(1, (os.cpu_count() or 2) // self.workers)
+                # Forking after ONNX Runtime has started its thread pools can
+                # deadlock the children, so start clean interpreters
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_pool_worker,
+                    initargs=(self.model_path, self.voices_path, threads),
+                )
+            else:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        return self.executor
+
+    def map(self, sentences, voice, speed, lang, phonemize=None):
+        """Yield (samples, sample_rate) for each sentence, in order.
+
+        `phonemize(text, lang)` is used on the thread pool path, defaulting to
+        the Kokoro tokenizer.
+        """
+        if self.use_processes:
+            n = len(sentences)
+            return self._get_executor().map(
+                _synthesize_sentence, sentences, [voice] * n, [speed] * n, [lang] * n
+            )
+        if not hasattr(self.kokoro, "tokenizer"):
+            # Older kokoro-onnx can't take phonemes, and create() must not run
+            # concurrently (see below), so synthesize in order
+            return (self.kokoro.create(text=sentence, voice=voice, speed=speed, lang=lang)
+                    for sentence in sentences)
+
+        # espeak-ng keeps shared C state and is not thread-safe, so phonemize
+        # here and only run the ONNX session concurrently
+        phonemize = phonemize or self.kokoro.tokenizer.phonemize
+        phonemes = [phonemize(sentence, lang) for sentence in sentences]
+        return self._get_executor().map(
+            lambda ps: self.kokoro.create(text=ps, voice=voice, speed=speed, lang=lang,
+                                          is_phonemes=True),
+            phonemes,
+        )
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+def open_sentence_pool(kokoro, model_path, voices_path, workers):
+    """Create a SentencePool, or None when parallel synthesis is disabled."""
+    if workers <= 1:
+        return None
+    return SentencePool(kokoro, model_path, voices_path, workers)
+
+
+def generate_chunks(kokoro, text, voice, speed, lang, phoneme_cache=None, sentence_pool=None):
+    """Yield (samples, sample_rate) chunks as Kokoro produces them."""
+    text = normalize_whitespace(text)
+    if sentence_pool is not None and len(text) > PARALLEL_TEXT_THRESHOLD:
+        sentences = split_sentences(text)
+        if len(sentences) > 1:
+            phonemize = phoneme_cache.lookup if phoneme_cache is not None else None
+            yield from sentence_pool.map(sentences, voice, speed, lang, phonemize)
+            return
+
+    if hasattr(kokoro, "create_stream"):
+        if phoneme_cache is not None:
+            phonemes = phoneme_cache.lookup(text, lang)
+            stream = kokoro.create_stream(phonemes, voice=voice, speed=speed, lang=lang,
+                                          is_phonemes=True)
+        else:
+            stream = kokoro.create_stream(text, voice=voice, speed=speed, lang=lang)
+        yield from iterate_async(stream)
+        return
+
+    # Older kokoro-onnx releases: stream sentence by sentence instead
+    for sentence in split_sentences(text):
+        yield kokoro.create(text=sentence, voice=voice, speed=speed, lang=lang)
+
+
+class Pcm16WavWriter:
+    """Streaming writer for mono 16-bit PCM WAV files.
+
+    Writes the 44-byte RIFF header directly and converts float samples with a
+    single vectorized clip/scale, avoiding libsndfile's generic format dispatch.
+    The header sizes are patched on close once the frame count is known.
+    """
+
+    def __init__(self, path, samplerate):
+        self.samplerate = samplerate
+        self.frames = 0
+        self.f = open(path, "wb")
+        self.f.write(self._header())
+
+    def _header(self):
+        data_size = self.frames * 2
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, 1, self.samplerate, self.samplerate * 2, 2, 16,
+            b"data", data_size,
+        )
+
+    def write(self, samples):
+        pcm = np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0)
+        (pcm * 32767).astype("<i2").tofile(self.f)
+        self.frames += len(pcm)
+
+    def close(self):
+        self.f.seek(0)
+        self.f.write(self._header())
+        self.f.close()
+
+
+def open_writer(output, samplerate):
+    """Open an audio writer for output: the fast PCM16 path for .wav, soundfile otherwise.
+
+    Other formats use libsndfile's default subtype for the file extension, as
+    sf.write does; PCM_16 is not valid for formats such as Ogg.
+    """
+    if output.lower().endswith(".wav"):
+        return Pcm16WavWriter(output, samplerate)
+    return sf.SoundFile(output, "w", samplerate=samplerate, channels=1)
+
+
+def write_chunks(output, chunks):
+    """Append audio chunks to a 16-bit PCM WAV file as they arrive.
+
+    The file is only created once the first non-empty chunk is available.
+    Returns a (total_samples, sample_rate) tuple.
+    """
+    f = None
+    total_samples = 0
+    sample_rate = None
+    try:
+        for samples, sr in chunks:
+            if samples is None or len(samples) == 0:
+                continue
+            if f is None:
+                sample_rate = sr
+                f = open_writer(output, sr)
+            f.write(samples)
+            total_samples += len(samples)
+    finally:
+        if f is not None:
+            f.close()
+    return total_samples, sample_rate
+
+
+def synthesize(kokoro, text, output, voice=DEFAULT_VOICE, speed=DEFAULT_SPEED,
+               lang=DEFAULT_LANGUAGE, phoneme_cache=None, sentence_pool=None):
+    """Generate speech with an already-initialized Kokoro instance.
+
+    Audio is streamed to the output file chunk by chunk rather than buffered
+    in full. Returns the duration of the generated audio in seconds.
+    """
+    print(f"[MAIN] Generating speech for: '{text}'", file=sys.stderr)
+    print(f"[MAIN] Language: {lang}, Voice: {voice}, Speed: {speed}", file=sys.stderr)
+
+    # Ensure output directory exists
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Generate audio and write it as it arrives
+    print(f"[MAIN] Writing output to: {output}", file=sys.stderr)
+    total_samples, sample_rate = write_chunks(
+        output, generate_chunks(kokoro, text, voice, speed, lang, phoneme_cache, sentence_pool)
+    )
+
+    if total_samples == 0:
+        raise RuntimeError("No audio generated")
+
+    duration = total_samples / sample_rate
+    print(f"[MAIN] Success! Audio saved to: {output}", file=sys.stderr)
+    print(f"[MAIN] Duration: {duration:.2f}s, Sample rate: {sample_rate}Hz", file=sys.stderr)
+    return duration
+
+
+def mmap_voices(voices_path):
+    """Memory-map each voice in an uncompressed .npz voices file.
+
+    Returns a name -> read-only array mapping whose pages are shared through
+    the OS page cache, so worker processes don't each hold a private copy and
+    only voices actually used become resident. Returns None if the file can't
+    be mapped (e.g. compressed members), leaving Kokoro's own loader in place.
+    """
+    voices = {}
+    try:
+        with zipfile.ZipFile(voices_path) as archive, open(voices_path, "rb") as f:
+            for info in archive.infolist():
+                if info.compress_type != zipfile.ZIP_STORED or not info.filename.endswith(".npy"):
+                    return None
+                # Member data follows the 30-byte local header plus its name and extra field
+                f.seek(info.header_offset + 26)
+                name_len, extra_len = struct.unpack("<HH", f.read(4))
+                f.seek(info.header_offset + 30 + name_len + extra_len)
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                voices[info.filename[:-len(".npy")]] = np.memmap(
+                    voices_path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        print(f"[MAIN] Could not memory-map voices, loading normally: {e}", file=sys.stderr)
+        return None
+    return voices
+
+
+def load_kokoro(model_path, voices_path, intra_op_threads=None):
+    """Initialize Kokoro from the given model and voices files."""
+    model_path = resolve_model_path(model_path)
+    print("[MAIN] Initializing Kokoro TTS...", file=sys.stderr)
+    print(f"[MAIN] Model: {model_path}", file=sys.stderr)
+    print(f"[MAIN] Voices: {voices_path}", file=sys.stderr)
+    # Older kokoro-onnx releases cannot take a prebuilt session
+    if not hasattr(Kokoro, "from_session"):
+        kokoro = Kokoro(model_path, voices_path)
+    else:
+        kokoro = Kokoro.from_session(create_session(model_path, intra_op_threads), voices_path)
+    voices = mmap_voices(voices_path) if hasattr(kokoro, "voices") else None
+    if voices:
+        kokoro.voices = voices
+    return kokoro
+
+
+def open_phoneme_cache(kokoro):
+    """Create a PhonemeCache if this kokoro-onnx exposes its tokenizer, else None.
+
+    The cache is kept on disk only when KOKORO_PHONEME_CACHE=1.
+    """
+    if not hasattr(kokoro, "tokenizer") or not hasattr(kokoro, "create_stream"):
+        return None
+    persist = os.getenv("KOKORO_PHONEME_CACHE") == "1"
+    return PhonemeCache(kokoro, DEFAULT_PHONEME_CACHE_PATH if persist else None)
+
+
+def emit(message):
+    """Write a single JSON response line to stdout."""
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def parse_request(line):
+    """Parse and validate one worker request line.
+
+    Returns a (params, error_response) tuple; exactly one of them is None.
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return None, {"ok": False, "error": f"Invalid JSON request: {e}"}
+    if not isinstance(request, dict):
+        return None, {"ok": False, "error": "Request must be a JSON object"}
+
+    request_id = request.get("id")
+    text = request.get("text", "")
+    output = request.get("output")
+    try:
+        speed = float(request.get("speed", DEFAULT_SPEED))
+    except (TypeError, ValueError):
+        return None, {"id": request_id, "ok": False, "error": "Speed must be a number"}
+
+    if not output:
+        return None, {"id": request_id, "ok": False, "error": "Output path is required"}
+    error = validate_request(text, speed)
+    if error:
+        return None, {"id": request_id, "ok": False, "error": error}
+
+    return {
+        "id": request_id,
+        "text": text,
+        "output": output,
+        "voice": request.get("voice") or DEFAULT_VOICE,
+        "speed": speed,
+        "lang": request.get("lang") or DEFAULT_LANGUAGE,
+    }, None
+
+
+def handle_request(kokoro, line, phoneme_cache=None, sentence_pool=None):
+    """Process one worker request line and return the response message."""
+    params, error_response = parse_request(line)
+    if error_response:
+        return error_response
+
+    try:
+        duration = synthesize(
+            kokoro,
+            params["text"],
+            params["output"],
+            voice=params["voice"],
+            speed=params["speed"],
+            lang=params["lang"],
+            phoneme_cache=phoneme_cache,
+            sentence_pool=sentence_pool
+        )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return {"id": params["id"], "ok": False, "error": str(e)}
+
+    return {"id": params["id"], "ok": True, "output": params["output"], "duration": duration}
+
+
+def serve(model_path, voices_path, use_phoneme_cache=True, workers=DEFAULT_WORKERS):
+    """Run as a persistent worker, loading the model once and serving stdin requests."""
+    # Requests are UTF-8 JSON whatever the platform's locale encoding is
+    sys.stdin.reconfigure(encoding="utf-8")
+
+    kokoro = load_kokoro(model_path, voices_path)
+    phoneme_cache = open_phoneme_cache(kokoro) if use_phoneme_cache else None
+    sentence_pool = open_sentence_pool(kokoro, model_path, voices_path, workers)
+
+    emit({"ready": True})
+    print("[WORKER] Ready for requests", file=sys.stderr)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            emit(handle_request(kokoro, line, phoneme_cache, sentence_pool))
+
+    print("[WORKER] stdin closed, shutting down", file=sys.stderr)
+    if sentence_pool is not None:
+        sentence_pool.shutdown()
+
+
 def main():
     """Main entry point for the script"""
     parser = argparse.ArgumentParser(
@@ -63,14 +648,19 @@ Examples:
   python kokoro_runner.py --text "Custom voice" --output voice.wav --voice af_alloy
   python kokoro_runner.py --text "Fast speech" --output fast.wav --speed 1.5
   python kokoro_runner.py --text "Bonjour" --output french.wav --lang fr-fr --voice ff_siwis
+  python kokoro_runner.py --serve
         """
     )
     
-    # Required arguments
-    parser.add_argument("--text", required=True, type=str,
+    # Required arguments (one-shot mode)
+    parser.add_argument("--text", type=str,
                        help="Text to convert to speech")
-    parser.add_argument("--output", required=True, type=str,
+    parser.add_argument("--output", type=str,
                        help="Output WAV file path")
+
+    # Worker mode
+    parser.add_argument("--serve", action="store_true",
+                       help="Run as a persistent worker reading JSON requests from stdin")
     
     # Optional generation parameters
     parser.add_argument("--speed", type=float, default=DEFAULT_SPEED,
@@ -80,6 +670,14 @@ Examples:
     parser.add_argument("--voice", type=str, default=DEFAULT_VOICE,
                        help=f"Voice name (default: {DEFAULT_VOICE})")
     
+    parser.add_argument("--workers", type=int, default=None,
+                       help=f"Parallel sentence workers for texts over {PARALLEL_TEXT_THRESHOLD} "
+                            f"characters, 1 to disable (default: {DEFAULT_WORKERS} with --serve, "
+                            f"1 otherwise)")
+    parser.add_argument("--no-phoneme-cache", action="store_true",
+                       help="Disable the phoneme cache (kept on disk in ~/.cache/local-voice-mcp/ "
+                            "when KOKORO_PHONEME_CACHE=1)")
+    
     # Model paths
     parser.add_argument("--model", type=str, default=DEFAULT_MODEL_PATH,
                        help=f"Path to kokoro ONNX model (default: {DEFAULT_MODEL_PATH})")
@@ -88,54 +686,53 @@ Examples:
     
     args = parser.parse_args()
     
-    # Validate arguments
-    if not args.text.strip():
-        print("Error: Text cannot be empty", file=sys.stderr)
-        sys.exit(1)
+    if args.serve:
+        check_required_files(args.model, args.voices)
+        import_dependencies()
+        try:
+            serve(
+                args.model,
+                args.voices,
+                use_phoneme_cache=not args.no_phoneme_cache,
+                workers=DEFAULT_WORKERS if args.workers is None else args.workers
+            )
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            sys.exit(1)
+        return
     
-    if args.speed < 0.5 or args.speed > 2.0:
-        print("Error: Speed must be between 0.5 and 2.0", file=sys.stderr)
+    if args.text is None or args.output is None:
+        parser.error("--text and --output are required unless --serve is given")
+    
+    # Validate arguments
+    error = validate_request(args.text, args.speed)
+    if error:
+        print(f"Error: {error}", file=sys.stderr)
         sys.exit(1)
     
     # Check for required files
     check_required_files(args.model, args.voices)
+    import_dependencies()
     
     try:
-        # Initialize Kokoro
-        print("[MAIN] Initializing Kokoro TTS...", file=sys.stderr)
-        print(f"[MAIN] Model: {args.model}", file=sys.stderr)
-        print(f"[MAIN] Voices: {args.voices}", file=sys.stderr)
-        
-        kokoro = Kokoro(args.model, args.voices)
-        
-        # Generate speech
-        print(f"[MAIN] Generating speech for: '{args.text}'", file=sys.stderr)
-        print(f"[MAIN] Language: {args.lang}, Voice: {args.voice}, Speed: {args.speed}", file=sys.stderr)
-        
-        # Call Kokoro to generate audio
-        samples, sample_rate = kokoro.create(
-            text=args.text,
+        kokoro = load_kokoro(args.model, args.voices)
+        phoneme_cache = None if args.no_phoneme_cache else open_phoneme_cache(kokoro)
+        # A one-shot run would pay a cold model load per pool worker, so
+        # parallel sentences are only used here when asked for explicitly
+        sentence_pool = open_sentence_pool(kokoro, args.model, args.voices, args.workers or 1)
+        synthesize(
+            kokoro,
+            args.text,
+            args.output,
             voice=args.voice,
             speed=args.speed,
-            lang=args.lang
+            lang=args.lang,
+            phoneme_cache=phoneme_cache,
+            sentence_pool=sentence_pool
         )
-        
-        if samples is None or len(samples) == 0:
-            print("Error: No audio generated", file=sys.stderr)
-            sys.exit(1)
-        
-        # Ensure output directory exists
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write output file
-        print(f"[MAIN] Writing output to: {args.output}", file=sys.stderr)
-        sf.write(args.output, samples, sample_rate)
-        
-        duration = len(samples) / sample_rate
-        print(f"[MAIN] Success! Audio saved to: {args.output}", file=sys.stderr)
-        print(f"[MAIN] Duration: {duration:.2f}s, Sample rate: {sample_rate}Hz", file=sys.stderr)
-        
+        if sentence_pool is not None:
+            sentence_pool.shutdown()
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
@@ -144,4 +741,3 @@ Examples:
 
 if __name__ == "__main__":
     main()
-
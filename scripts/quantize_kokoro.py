@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Kokoro INT8 Quantization Script
+
+Converts the FP32 Kokoro ONNX model into an INT8 dynamically quantized copy.
+Only MatMul/Gemm weights are quantized; quantizing Conv layers slows inference
+down on most CPUs. No calibration data is required.
+
+kokoro_runner.py automatically picks up the quantized model when it sits next
+to the FP32 model (kokoro-v1.0.onnx -> kokoro-v1.0.int8.onnx) and the active
+execution provider is CPU or DirectML.
+
+Usage:
+    python quantize_kokoro.py [--input kokoro-v1.0.onnx] [--output kokoro-v1.0.int8.onnx]
+"""
+
+import argparse
+import os
+import sys
+import traceback
+
+try:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+except ImportError as e:
+    print(f"Error: Required dependency not found: {e}", file=sys.stderr)
+    print("Please install required packages:", file=sys.stderr)
+    print("  pip install onnx onnxruntime", file=sys.stderr)
+    sys.exit(1)
+
+DEFAULT_INPUT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "kokoro-tts", "kokoro-v1.0.onnx"
+)
+QUANTIZED_OP_TYPES = ["MatMul", "Gemm"]
+
+
+def main():
+    """Main entry point for the script"""
+    parser = argparse.ArgumentParser(description="Quantize the Kokoro ONNX model to INT8")
+    parser.add_argument("--input", type=str, default=DEFAULT_INPUT_PATH,
+                       help=f"Path to FP32 kokoro ONNX model (default: {DEFAULT_INPUT_PATH})")
+    parser.add_argument("--output", type=str,
+                       help="Path for the INT8 model (default: <input>.int8.onnx)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"Error: Model file not found: {args.input}", file=sys.stderr)
+        sys.exit(1)
+
+    output = args.output or os.path.splitext(args.input)[0] + ".int8.onnx"
+
+    try:
+        print(f"[QUANTIZE] Input: {args.input}", file=sys.stderr)
+        print(f"[QUANTIZE] Output: {output}", file=sys.stderr)
+        print(f"[QUANTIZE] Op types: {', '.join(QUANTIZED_OP_TYPES)}", file=sys.stderr)
+        quantize_dynamic(
+            model_input=args.input,
+            model_output=output,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=QUANTIZED_OP_TYPES,
+        )
+        in_mb = os.path.getsize(args.input) / 1024 / 1024
+        out_mb = os.path.getsize(output) / 1024 / 1024
+        print(f"[QUANTIZE] Done: {in_mb:.1f}MB -> {out_mb:.1f}MB", file=sys.stderr)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
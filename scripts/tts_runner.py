@@ -1,26 +1,72 @@
 import argparse
-import glob
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import json
 import logging
 import os
 import platform
+import queue
+import sys
 import tempfile
-import shutil
+import threading
+import time
+
+try:
+    import orjson as _json_parser  # Optional: faster request parsing in --serve mode
+except ImportError:
+    _json_parser = json
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Values accepted by the LOCAL_VOICE_DEVICE override
+SUPPORTED_BACKENDS = ("mlx", "vllm", "cuda", "mps", "cpu")
+
+# MLX weights used on Apple Silicon
+MLX_MODEL_ID = "mlx-community/chatterbox-turbo-6bit"
+
+# Torch-TensorRT engine cache, keyed by GPU compute capability
+TENSORRT_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "local-voice-mcp", "trt")
+
+# Cached reference-voice conditionals, keyed by clip hash and chatterbox version
+SPEAKER_CACHE_ROOT = os.getenv(
+    "CHATTERBOX_SPEAKER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "local-voice-mcp", "spk"),
+)
 
+# --serve request batching (only the vLLM backend generates batches)
+DEFAULT_MAX_BATCH = 8
+DEFAULT_BATCH_WINDOW_MS = 10
+
+
+@functools.lru_cache(maxsize=1)
 def detect_backend():
     """
     Auto-detect the optimal backend based on available hardware.
 
     Priority:
     1. MLX (Apple Silicon with mlx-audio installed)
-    2. CUDA (NVIDIA GPU)
+    2. CUDA (NVIDIA GPU; chatterbox-vllm if CHATTERBOX_BACKEND=vllm)
     3. MPS (Apple Silicon without MLX - fallback to PyTorch MPS)
     4. CPU (fallback)
+
+    The result is cached since the CUDA/MPS probes initialize the driver.
+    Setting LOCAL_VOICE_DEVICE skips probing entirely.
     """
+    override = os.getenv("LOCAL_VOICE_DEVICE", "").strip().lower()
+    if override:
+        if override in SUPPORTED_BACKENDS:
+            logger.info(f"Using backend from LOCAL_VOICE_DEVICE: {override}")
+            return override
+        logger.warning(
+            f"Ignoring unknown LOCAL_VOICE_DEVICE '{override}' "
+            f"(expected one of: {', '.join(SUPPORTED_BACKENDS)})"
+        )
+
     # Check for Apple Silicon with MLX
     # Use platform.machine() which reliably returns "arm64" on Apple Silicon
     if platform.system() == "Darwin" and platform.machine() in ("arm64", "aarch64"):
@@ -44,6 +90,13 @@ def detect_backend():
 
     # Check for CUDA
     if torch.cuda.is_available():
+        if os.getenv("CHATTERBOX_BACKEND") == "vllm":
+            try:
+                import chatterbox_vllm  # noqa: F401
+                logger.info("CUDA detected - using chatterbox-vllm backend")
+                return "vllm"
+            except ImportError:
+                logger.warning("CHATTERBOX_BACKEND=vllm but chatterbox-vllm is not installed; using PyTorch")
         logger.info("CUDA detected - using PyTorch CUDA backend")
         return "cuda"
 
@@ -56,6 +109,15 @@ def detect_backend():
     return "cpu"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_mlx_model():
+    """Load the MLX Chatterbox Turbo model, cached for the life of the process."""
+    from mlx_audio.tts.utils import load_model
+
+    logger.info(f'Initializing {MLX_MODEL_ID} with mlx-audio')
+    return load_model(MLX_MODEL_ID)
+
+
 def generate_with_mlx(text, output_path, ref_audio=None):
     """Generate audio using MLX backend (Apple Silicon optimized).
 
@@ -66,7 +128,7 @@ def generate_with_mlx(text, output_path, ref_audio=None):
 
     logger.info("Generating audio with MLX backend (chatterbox-turbo-6bit)")
 
-    # Convert to absolute path before any directory changes to avoid path issues
+    # Convert to absolute path so the file prefix passed to mlx_audio is absolute
     output_path = os.path.abspath(output_path)
 
     # Re-validate the absolute path to prevent path traversal attacks
@@ -77,120 +139,474 @@ def generate_with_mlx(text, output_path, ref_audio=None):
     output_dir = os.path.dirname(output_path)
     output_basename = os.path.basename(output_path).replace(".wav", "")
 
-    # Save the current working directory
-    original_cwd = os.getcwd()
+    # mlx_audio writes straight into the (validated) output directory via an
+    # absolute prefix, so no working-directory change or cross-directory move
+    # is needed. Refuse up front if the destination is a symlink.
+    if os.path.islink(output_path):
+        raise ValueError("Destination path is a symlink; refusing to overwrite")
+
+    # Ensure output directory exists
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    file_prefix = os.path.join(output_dir, output_basename)
+
+    # Generate audio - mlx_audio saves files as {prefix}.wav or {prefix}_000.wav.
+    # Passing the loaded model (rather than its repo id) skips a reload per call.
+    generate_audio(
+        text=text,
+        model=_get_mlx_model(),
+        ref_audio=ref_audio,
+        file_prefix=file_prefix,
+        audio_format="wav",
+        join_audio=True,
+        verbose=True
+    )
+
+    # join_audio=True yields a single file named by a known convention, so
+    # check the candidates directly instead of scanning the directory
+    candidates = [f"{file_prefix}.wav", f"{file_prefix}_000.wav"]
+    generated_file = next((c for c in candidates if os.path.isfile(c)), None)
+
+    if generated_file is None:
+        raise FileNotFoundError(
+            f"MLX audio output not found with prefix '{output_basename}' in {output_dir}"
+        )
+
+    # Same directory, so this is an atomic rename rather than a copy
+    if os.path.abspath(generated_file) != output_path:
+        os.replace(generated_file, output_path)
+        logger.info("Renamed output from %s to %s", generated_file, output_path)
+    else:
+        logger.info("Output file already at correct location: %s", output_path)
 
-    # Use an isolated temporary working directory for generation
-    # Create in system temp dir for security (validated by validate_output_path in main)
-    system_temp = tempfile.gettempdir()
-    safe_work_dir = tempfile.mkdtemp(prefix="mlx_audio_", dir=system_temp)
+
+def enable_tensorrt(model):
+    """Compile the S3Gen vocoder with Torch-TensorRT in FP16 (CUDA only).
+
+    Engines are cached per GPU architecture under TENSORRT_CACHE_ROOT so the
+    build cost is only paid once. If compilation or inference fails, the
+    original PyTorch implementation is restored and used instead.
+    """
+    import torch
 
     try:
-        # Change to safe working directory
-        os.chdir(safe_work_dir)
+        import torch_tensorrt  # noqa: F401 - registers the "tensorrt" backend
+    except ImportError:
+        logger.warning("CHATTERBOX_TENSORRT is set but torch-tensorrt is not installed; using PyTorch")
+        return
 
-        # Ensure output directory exists
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
+    major, minor = torch.cuda.get_device_capability()
+    cache_dir = os.path.join(TENSORRT_CACHE_ROOT, f"sm_{major}{minor}")
+    os.makedirs(cache_dir, exist_ok=True)
+
+    s3gen = model.s3gen
+    original_inference = s3gen.inference
+    compiled_inference = torch.compile(
+        original_inference,
+        backend="tensorrt",
+        dynamic=True,
+        options={
+            "enabled_precisions": {torch.float16},
+            "optimization_level": 3,
+            "cache_built_engines": True,
+            "reuse_cached_engines": True,
+            "engine_cache_dir": cache_dir,
+        },
+    )
+
+    def inference(*args, **kwargs):
+        try:
+            return compiled_inference(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"TensorRT inference failed ({e}), falling back to PyTorch")
+            s3gen.inference = original_inference
+            return original_inference(*args, **kwargs)
 
-        # Generate audio - mlx_audio saves files in current directory with pattern {prefix}_000.wav
-        generate_audio(
-            text=text,
-            model="mlx-community/chatterbox-turbo-6bit",
-            ref_audio=ref_audio,
-            file_prefix=output_basename,
-            audio_format="wav",
-            join_audio=True,
-            verbose=True
-        )
+    s3gen.inference = inference
+    logger.info(f"TensorRT enabled for S3Gen (engine cache: {cache_dir})")
 
-        # Find the generated file using glob pattern (more robust than hardcoded names)
-        generated_files = glob.glob(f"{output_basename}*.wav")
 
-        if not generated_files:
-            raise FileNotFoundError(
-                f"MLX audio output not found with prefix '{output_basename}' in {safe_work_dir}"
-            )
+def enable_torch_compile(model):
+    """Compile T3's transformer and the S3Gen vocoder with torch.compile (CUDA only).
+
+    Inductor fuses the many small pointwise kernels of batch-1 decoding.
+    CUDA graphs ("reduce-overhead") are deliberately not used: T3 feeds a KV
+    cache that grows every step back into the transformer, so graphs would be
+    re-recorded per sequence length and the graph-owned cache outputs would
+    be overwritten on replay. Compilation happens on first use, so callers
+    should warm up before serving. Returns a function that restores the
+    eager modules if that warm-up fails.
+    """
+    import torch
 
-        # With join_audio=True, we expect one file
-        generated_file = generated_files[0]
-        src_abs = os.path.join(safe_work_dir, generated_file)
+    originals = []
+    # T3's generation loop calls the transformer directly, so compile that
+    # rather than the T3 module's own forward
+    if hasattr(model.t3, "tfmr"):
+        originals.append((model.t3, "tfmr", model.t3.tfmr))
+        model.t3.tfmr = torch.compile(model.t3.tfmr, mode="max-autotune-no-cudagraphs", dynamic=True)
+    # The TensorRT path already compiles the vocoder
+    if os.getenv("CHATTERBOX_TENSORRT") != "1":
+        originals.append((model.s3gen, "inference", model.s3gen.inference))
+        model.s3gen.inference = torch.compile(model.s3gen.inference, dynamic=True)
+    logger.info("torch.compile enabled for T3 and S3Gen")
 
-        # Security check: ensure destination is not a symlink
-        if os.path.exists(output_path) and os.path.islink(output_path):
-            raise ValueError("Destination path is a symlink; refusing to overwrite")
+    def restore():
+        for owner, name, original in originals:
+            setattr(owner, name, original)
 
-        # Check if source and destination are different before moving
-        if os.path.abspath(src_abs) != os.path.abspath(output_path):
-            shutil.move(src_abs, output_path)
-            logger.info(f"Moved output from {generated_file} to {output_path}")
-        else:
-            logger.info(f"Output file already at correct location: {output_path}")
+    return restore
 
-    finally:
-        # Restore original working directory
-        os.chdir(original_cwd)
-        # Clean up temporary working directory
-        try:
-            shutil.rmtree(safe_work_dir)
-        except Exception as e:
-            logger.warning(f"Failed to clean up temp directory {safe_work_dir}: {e}")
 
+def quantize_t3_int8(model, device):
+    """Quantize the T3 language model's Linear weights to int8.
 
-def generate_with_pytorch(text, output_path, ref_audio=None, device="cuda"):
-    """Generate audio using PyTorch backend (CUDA/MPS/CPU)."""
+    T3 decodes autoregressively at batch size 1, so it is bound by weight
+    bandwidth; int8 weights halve the bytes read per token. The S3Gen vocoder
+    is left at full precision to protect audio quality. CPU uses PyTorch's
+    dynamic quantization; CUDA needs torchao. Other devices are skipped.
+    """
     import torch
-    import torchaudio as ta
-    from chatterbox.tts_turbo import ChatterboxTurboTTS
 
-    logger.info(f"Generating audio with PyTorch backend on device: {device}")
+    if device == "cpu":
+        model.t3 = torch.ao.quantization.quantize_dynamic(
+            model.t3, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    elif device == "cuda":
+        try:
+            from torchao.quantization import int8_weight_only, quantize_
+        except ImportError:
+            logger.warning("CHATTERBOX_INT8 is set but torchao is not installed; using full precision")
+            return
+        quantize_(model.t3, int8_weight_only())
+    else:
+        logger.warning(f"CHATTERBOX_INT8 is not supported on {device}; using full precision")
+        return
+
+    logger.info(f"Quantized T3 to int8 on {device}")
+
+
+# Serializes stdout writes between the main loop and writer callbacks
+_emit_lock = threading.Lock()
 
-    # Patch torch.load to use the correct device
+# Serializes the scoped torch.load override in _torch_load_on()
+_torch_load_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _torch_load_on(device):
+    """Default torch.load's map_location to the target device within this block only.
+
+    Chatterbox loads some checkpoints without a map_location; this keeps those
+    off the wrong device without leaving torch.load patched for the rest of
+    the process.
+    """
+    import torch
+
+    target = torch.device(device)
     original_torch_load = torch.load
 
-    def patched_load(*args, **kwargs):
+    def load_on_device(*args, **kwargs):
         if 'map_location' not in kwargs:
-            kwargs['map_location'] = torch.device(device)
+            kwargs['map_location'] = target
         return original_torch_load(*args, **kwargs)
 
-    torch.load = patched_load
+    with _torch_load_lock:
+        torch.load = load_on_device
+        try:
+            yield
+        finally:
+            torch.load = original_torch_load
 
+
+@functools.lru_cache(maxsize=1)
+def _configure_torch():
+    """Pin torch thread pools once per process, before any inference runs."""
+    import torch
+
+    # Half the logical cores avoids oversubscription against other TTS/ONNX processes
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
     try:
-        # Initialize Chatterbox Turbo
-        logger.info('Initializing ChatterboxTurbo TTS')
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before inter-op parallel work has started
+        logger.warning("Could not set torch inter-op threads; already initialized")
+
+
+def _inference_context(device):
+    """Context for model.generate(): no autograd, plus opt-in FP16 autocast on CUDA."""
+    import torch
+
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    if device == "cuda" and os.getenv("CHATTERBOX_AUTOCAST") == "1":
+        stack.enter_context(torch.autocast(device_type="cuda", dtype=torch.float16))
+    return stack
+
+
+def _readahead(path):
+    """Ask the kernel to start reading a file into the page cache without waiting for it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug("Could not prefetch %s: %s", path, e)
+
+
+def _prefetch_checkpoints():
+    """Start reading every cached Chatterbox checkpoint file in the background.
+
+    from_pretrained loads the voice encoder, T3 and S3Gen weights one after
+    another; asking the kernel to read them all up front overlaps their disk
+    reads so the serial loads are served from the page cache. Skipped if the
+    model has not been downloaded yet, or without posix_fadvise (Windows,
+    macOS), where reading the files first would only delay the load.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        from chatterbox.tts_turbo import REPO_ID
+        from huggingface_hub import snapshot_download
+
+        ckpt_dir = snapshot_download(repo_id=REPO_ID, local_files_only=True)
+    except Exception as e:
+        logger.debug(f"Skipping checkpoint prefetch: {e}")
+        return
+
+    for name in os.listdir(ckpt_dir):
+        if name.endswith((".safetensors", ".pt")):
+            _readahead(os.path.join(ckpt_dir, name))
+
+
+@functools.lru_cache(maxsize=2)
+def _get_model(device):
+    """Load ChatterboxTurboTTS for a device, cached for the life of the process."""
+    from chatterbox.tts_turbo import ChatterboxTurboTTS
+
+    _configure_torch()
+
+    logger.info(f'Initializing ChatterboxTurbo TTS on {device}')
+    _prefetch_checkpoints()
+    with _torch_load_on(device):
         model = ChatterboxTurboTTS.from_pretrained(device=device)
 
-        # Generate speech
-        logger.info('Generating speech...')
-        wav = model.generate(text, audio_prompt_path=ref_audio)
-        logger.info('Speech generation complete')
+    if os.getenv("CHATTERBOX_INT8") == "1":
+        quantize_t3_int8(model, device)
 
-        # Ensure audio tensor has correct dimensions [channels, samples]
-        if wav.dim() == 1:
-            wav = wav.unsqueeze(0)
+    if device == "cuda" and os.getenv("CHATTERBOX_CUDNN_BENCHMARK") == "1":
+        import torch
 
-        # Save to file
-        logger.info(f'Saving audio to {output_path}')
-        ta.save(output_path, wav, model.sr)
-        logger.info('Audio saved successfully')
-    finally:
-        # Restore original torch.load
-        torch.load = original_torch_load
+        # Autotunes per input shape, so it only pays off once shapes repeat
+        # (e.g. a long-lived --serve worker with similar-length requests)
+        torch.backends.cudnn.benchmark = True
 
+    if device == "cuda" and os.getenv("CHATTERBOX_TENSORRT") == "1":
+        enable_tensorrt(model)
 
-def validate_output_path(output_path):
-    """Validate that output path is within an allowed temporary directory."""
+    return model
+
+
+def _warm_file(path):
+    """Read a file once so a later open is served from the OS page cache."""
+    try:
+        with open(path, 'rb') as f:
+            while f.read(1 << 20):
+                pass
+    except OSError as e:
+        logger.debug("Could not prefetch %s: %s", path, e)
+
+
+def _prepare_for_save(wav):
+    """Return a contiguous (samples, channels) float32 array ready for _save_wav."""
+    wav = wav.unsqueeze(0) if wav.dim() == 1 else wav
+    assert wav.dim() == 2, f"expected [channels, samples] audio, got shape {tuple(wav.shape)}"
+    return wav.detach().float().cpu().t().contiguous().numpy()
+
+
+def _save_wav(output_path, samples, sample_rate):
+    """Write PCM16 WAV with libsndfile, avoiding torchaudio's per-call backend setup."""
+    import soundfile as sf
+
+    sf.write(output_path, samples, sample_rate, subtype='PCM_16')
+
+
+def _generate_streaming(model, text, output_path, ref_audio, device):
+    """Write audio chunks to disk as a streaming-capable model yields them.
+
+    Peak memory stays at one chunk instead of the whole utterance. Streaming
+    forks of Chatterbox yield either tensors or (tensor, metrics) tuples.
+    """
+    import soundfile as sf
+
+    logger.info('Generating speech (streaming)...')
+    with sf.SoundFile(output_path, 'w', samplerate=model.sr, channels=1, subtype='PCM_16') as f:
+        with _inference_context(device):
+            for chunk in model.generate_stream(text, audio_prompt_path=ref_audio):
+                if isinstance(chunk, tuple):
+                    chunk = chunk[0]
+                f.write(chunk.reshape(-1).float().cpu().numpy())
+    logger.info('Audio saved successfully')
+
+
+# Per device: the model's built-in conditionals, and the cache key currently loaded
+_default_conds = {}
+_active_reference = {}
+
+
+def _speaker_cache_path(ref_audio):
+    """Return the conditionals cache file for a reference clip, or None if unreadable."""
+    try:
+        version = importlib.metadata.version("chatterbox-tts")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    digest = hashlib.sha256(version.encode())
+    try:
+        with open(ref_audio, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return os.path.join(SPEAKER_CACHE_ROOT, f"{digest.hexdigest()}.pt")
+
+
+def _use_reference(model, ref_audio, device):
+    """Point model.conds at the conditionals for ref_audio, loading them from cache if possible.
+
+    Returns (audio_prompt_path, cache_path). audio_prompt_path is None when
+    no encoding is needed; cache_path is set when the conditionals generate()
+    computes from the clip should be saved afterwards.
+    """
+    _default_conds.setdefault(device, model.conds)
+    if not ref_audio:
+        model.conds = _default_conds[device]
+        _active_reference.pop(device, None)
+        return None, None
+
+    cache_path = _speaker_cache_path(ref_audio)
+    if cache_path is not None and _active_reference.get(device) == cache_path:
+        return None, None
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            from chatterbox.tts_turbo import Conditionals
+
+            model.conds = Conditionals.load(cache_path, map_location=device).to(device)
+            _active_reference[device] = cache_path
+            logger.info("Loaded cached speaker conditionals from %s", cache_path)
+            return None, None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable speaker cache {cache_path}: {e}")
+
+    # generate() will replace model.conds with freshly encoded ones
+    _active_reference.pop(device, None)
+    return ref_audio, cache_path
+
+
+def _save_reference(model, cache_path, device):
+    """Persist the conditionals generate() just computed from a reference clip."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        model.conds.save(cache_path)
+        _active_reference[device] = cache_path
+    except Exception as e:
+        logger.warning(f"Could not cache speaker conditionals: {e}")
+
+
+def generate_with_pytorch(text, output_path, ref_audio=None, device="cuda", writer=None):
+    """Generate audio using PyTorch backend (CUDA/MPS/CPU).
+
+    If a writer executor is given, the file is saved on it and the Future for
+    the save is returned, so the caller can start the next generation while
+    the WAV is encoded and written. Otherwise the file is saved before
+    returning None.
+    """
+    logger.info("Generating audio with PyTorch backend on device: %s", device)
+
+    if ref_audio and _get_model.cache_info().currsize == 0:
+        # Overlap reading the reference clip with a cold model load; once a
+        # model is cached there is no load to hide the read behind
+        threading.Thread(target=_warm_file, args=(ref_audio,), daemon=True).start()
+
+    model = _get_model(device)
+
+    # Reuse the encoded reference voice when this clip has been seen before
+    prompt_path, cache_path = _use_reference(model, ref_audio, device)
+
+    if hasattr(model, "generate_stream"):
+        _generate_streaming(model, text, output_path, prompt_path, device)
+        if cache_path:
+            _save_reference(model, cache_path, device)
+        return None
+
+    # Generate speech
+    logger.info('Generating speech...')
+    with _inference_context(device):
+        wav = model.generate(text, audio_prompt_path=prompt_path)
+    logger.info('Speech generation complete')
+    if cache_path:
+        _save_reference(model, cache_path, device)
+
+    # Save to file
+    wav = _prepare_for_save(wav)
+    logger.info('Saving audio to %s', output_path)
+    if writer is not None:
+        return writer.submit(_save_wav, output_path, wav, model.sr)
+    _save_wav(output_path, wav, model.sr)
+    logger.info('Audio saved successfully')
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vllm_model():
+    """Load the chatterbox-vllm model, cached for the life of the process."""
+    from chatterbox_vllm.tts import ChatterboxTTS
+
+    logger.info('Initializing chatterbox-vllm TTS on cuda')
+    return ChatterboxTTS.from_pretrained()
+
+
+def generate_with_vllm(texts, output_paths, ref_audio=None):
+    """Generate audio for several texts in one batched call to chatterbox-vllm (CUDA only).
+
+    This is a vLLM port of the original Chatterbox model rather than Turbo,
+    so paralinguistic tags are read as plain text.
+    """
+    logger.info("Generating %d utterance(s) with chatterbox-vllm backend", len(texts))
+
+    model = _get_vllm_model()
+    wavs = model.generate(list(texts), audio_prompt_path=ref_audio)
+
+    for wav, output_path in zip(wavs, output_paths):
+        logger.info('Saving audio to %s', output_path)
+        _save_wav(output_path, _prepare_for_save(wav), model.sr)
+    logger.info('Audio saved successfully')
+
+
+@functools.lru_cache(maxsize=1)
+def _allowed_temp_dirs():
+    """Resolve the allowed temporary directories once per process."""
     # Get allowed temporary directories using only the cross-platform tempfile module
     # This avoids hardcoding Unix-specific paths like /tmp
-    allowed_temp_dirs = []
-
     # System temp directory (cross-platform: /tmp on Unix, %TEMP% on Windows)
-    system_temp = os.path.realpath(tempfile.gettempdir())
-    allowed_temp_dirs.append(system_temp)
+    return (os.path.realpath(tempfile.gettempdir()),)
+
+
+def validate_output_path(output_path):
+    """Validate that output path is within an allowed temporary directory."""
+    allowed_temp_dirs = list(_allowed_temp_dirs())
 
     # Resolve the output path to handle symlinks
     output_real = os.path.realpath(output_path)
 
+    # Fast path: realpath() has already resolved every symlink, so a resolved
+    # path strictly inside an allowed temp dir needs no per-component checks
+    for temp_dir in allowed_temp_dirs:
+        if output_real.startswith(temp_dir + os.sep):
+            return
+
     # Check if output is within any allowed temp directory
     is_valid = False
     matched_temp_dir = None
@@ -229,41 +645,302 @@ def validate_output_path(output_path):
                     raise ValueError(f"Path contains symlinked component: {current}")
 
 
+def synthesize(text, output_path, ref_audio=None, backend=None, writer=None):
+    """Validate the output path and synthesize text with the given (or detected) backend.
+
+    Returns a Future for the file save when it was handed to `writer`
+    (PyTorch backends only), otherwise None once the file is written.
+    """
+    # Validate output path security
+    validate_output_path(output_path)
+
+    # Detect the best backend
+    if backend is None:
+        backend = detect_backend()
+
+    if backend == "mlx":
+        generate_with_mlx(
+            text=text,
+            output_path=output_path,
+            ref_audio=ref_audio
+        )
+    elif backend == "vllm":
+        generate_with_vllm(
+            texts=[text],
+            output_paths=[output_path],
+            ref_audio=ref_audio
+        )
+    else:
+        # Use PyTorch for cuda, mps, or cpu
+        return generate_with_pytorch(
+            text=text,
+            output_path=output_path,
+            ref_audio=ref_audio,
+            device=backend,
+            writer=writer
+        )
+    return None
+
+
+def emit(message):
+    """Write a single JSON response line to stdout."""
+    with _emit_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def emit_when_done(response):
+    """Emit a response now, or once its Future resolves (deferred file saves)."""
+    if isinstance(response, concurrent.futures.Future):
+        response.add_done_callback(lambda future: emit(future.result()))
+    else:
+        emit(response)
+
+
+def parse_request(line):
+    """Parse one request line, returning (request, None) or (None, error_response)."""
+    try:
+        request = _json_parser.loads(line)
+    except json.JSONDecodeError:
+        # orjson is stricter than json: it rejects lone surrogates, which
+        # JSON.stringify can emit, so retry with the standard parser
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return None, {"ok": False, "error": f"Invalid JSON request: {e}"}
+    if not isinstance(request, dict):
+        return None, {"ok": False, "error": "Request must be a JSON object"}
+    return request, None
+
+
+def validate_request(request):
+    """Check a worker request's fields, returning an error message or None."""
+    text = request.get("text", "")
+    if not isinstance(text, str) or not text.strip():
+        return "Input text cannot be empty"
+    if not request.get("output"):
+        return "Output path is required"
+    return None
+
+
+def _response_when_saved(save, request_id, output_path):
+    """Return a Future for the response that resolves when the save finishes."""
+    response = concurrent.futures.Future()
+
+    def on_saved(future):
+        error = future.exception()
+        if error is not None:
+            logger.error(f'Error saving audio: {error}')
+            response.set_result({"id": request_id, "ok": False, "error": str(error)})
+        else:
+            response.set_result({"id": request_id, "ok": True, "output": output_path})
+
+    save.add_done_callback(on_saved)
+    return response
+
+
+def handle_request(request, backend, writer=None):
+    """Process one worker request and return the response message.
+
+    With a writer executor the response may be a Future that resolves once
+    the output file has been saved.
+    """
+    request_id = request.get("id")
+    output_path = request.get("output")
+
+    error = validate_request(request)
+    if error:
+        return {"id": request_id, "ok": False, "error": error}
+
+    try:
+        save = synthesize(request["text"], output_path, ref_audio=request.get("reference_audio"),
+                          backend=backend, writer=writer)
+    except Exception as e:
+        logger.exception(f'Error in TTS synthesis: {str(e)}')
+        return {"id": request_id, "ok": False, "error": str(e)}
+
+    if save is not None:
+        return _response_when_saved(save, request_id, output_path)
+    return {"id": request_id, "ok": True, "output": output_path}
+
+
+def handle_vllm_batch(requests):
+    """Synthesize requests sharing a reference voice in one chatterbox-vllm call.
+
+    Requests that fail validation are answered individually; if the batched
+    call raises, every request in it gets the error.
+    """
+    responses = {}
+    groups = {}
+    for index, request in enumerate(requests):
+        error = validate_request(request)
+        if error is None:
+            try:
+                validate_output_path(request["output"])
+            except Exception as e:
+                error = str(e)
+        if error:
+            responses[index] = {"id": request.get("id"), "ok": False, "error": error}
+            continue
+        groups.setdefault(request.get("reference_audio"), []).append(index)
+
+    for ref_audio, indices in groups.items():
+        try:
+            generate_with_vllm(
+                texts=[requests[i]["text"] for i in indices],
+                output_paths=[requests[i]["output"] for i in indices],
+                ref_audio=ref_audio
+            )
+        except Exception as e:
+            logger.exception(f'Error in TTS synthesis: {str(e)}')
+            for i in indices:
+                responses[i] = {"id": requests[i].get("id"), "ok": False, "error": str(e)}
+            continue
+        for i in indices:
+            responses[i] = {"id": requests[i].get("id"), "ok": True, "output": requests[i]["output"]}
+
+    return [responses[i] for i in range(len(requests))]
+
+
+def read_requests(lines, pending):
+    """Reader thread body: queue non-empty request lines, then None at EOF.
+
+    None is also queued if reading fails, so the worker exits instead of
+    waiting forever on a dead reader.
+    """
+    try:
+        for line in lines:
+            line = line.strip()
+            if line:
+                pending.put(line)
+    finally:
+        pending.put(None)
+
+
+def collect_batch(pending, max_batch, window):
+    """Block for one request, then gather any already queued plus more arriving within `window` seconds.
+
+    With a zero window a lone request is returned immediately. Returns None
+    once stdin is exhausted.
+    """
+    first = pending.get()
+    if first is None:
+        return None
+
+    batch = [first]
+    deadline = time.monotonic() + window
+    while len(batch) < max_batch:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                line = pending.get(timeout=remaining)
+            else:
+                line = pending.get_nowait()
+        except queue.Empty:
+            break
+        if line is None:
+            # Leave the EOF marker for the next collect_batch call
+            pending.put(None)
+            break
+        batch.append(line)
+    return batch
+
+
+def serve(max_batch=DEFAULT_MAX_BATCH, batch_window_ms=DEFAULT_BATCH_WINDOW_MS):
+    """Run as a persistent worker, keeping the model loaded between stdin requests.
+
+    On the vLLM backend, requests arriving within the batch window are
+    generated together; other backends process them one at a time.
+    """
+    # Per-request INFO logs are relayed through the server's logger; keep only
+    # warnings by default once the worker is up
+    log_level = os.getenv("TTS_WORKER_LOG_LEVEL", "WARNING").upper()
+    # Requests are UTF-8 JSON whatever the platform's locale encoding is
+    sys.stdin.reconfigure(encoding="utf-8")
+
+    backend = detect_backend()
+    if backend == "vllm":
+        _get_vllm_model()
+    elif backend == "mlx":
+        _get_mlx_model()
+    else:
+        model = _get_model(backend)
+        # Compilation cost is only worth paying in a long-lived worker
+        if backend == "cuda" and os.getenv("CHATTERBOX_COMPILE") == "1":
+            restore = enable_torch_compile(model)
+            logger.info('Warming up compiled model...')
+            try:
+                with _inference_context(backend):
+                    model.generate("Warming up the speech model.")
+            except Exception as e:
+                logger.warning(f"torch.compile warm-up failed ({e}), falling back to eager")
+                restore()
+
+    pending = queue.Queue()
+    reader = threading.Thread(target=read_requests, args=(sys.stdin, pending), daemon=True)
+    reader.start()
+
+    # Saves run here so the next request's generation overlaps the WAV write
+    writer = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+    emit({"ready": True})
+    logger.info('Worker ready for requests')
+    level = logging.getLevelName(log_level)
+    logging.getLogger().setLevel(level if isinstance(level, int) else logging.WARNING)
+
+    window = batch_window_ms / 1000.0 if backend == "vllm" else 0
+    while True:
+        lines = collect_batch(pending, max_batch, window)
+        if lines is None:
+            break
+
+        requests = []
+        for line in lines:
+            request, error_response = parse_request(line)
+            if error_response:
+                emit(error_response)
+            else:
+                requests.append(request)
+
+        if backend == "vllm" and len(requests) > 1:
+            responses = handle_vllm_batch(requests)
+        else:
+            responses = [handle_request(request, backend, writer) for request in requests]
+        for response in responses:
+            emit_when_done(response)
+
+    logger.info('stdin closed, shutting down worker')
+    writer.shutdown(wait=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Chatterbox Turbo TTS Command Line')
-    parser.add_argument('--text', type=str, required=True, help='Text to synthesize')
-    parser.add_argument('--output', type=str, required=True, help='Output WAV file path')
+    parser.add_argument('--text', type=str, help='Text to synthesize')
+    parser.add_argument('--output', type=str, help='Output WAV file path')
     parser.add_argument('--reference_audio', type=str, help='Path to reference audio for voice cloning')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a persistent worker reading JSON requests from stdin')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help='Maximum requests generated together in --serve mode (vLLM backend)')
+    parser.add_argument('--batch-window-ms', type=float, default=DEFAULT_BATCH_WINDOW_MS,
+                        help='How long to wait for more requests to batch in --serve mode (vLLM backend)')
 
     args = parser.parse_args()
 
+    if args.serve:
+        serve(max(1, args.max_batch), max(0.0, args.batch_window_ms))
+        return
+
+    if args.text is None or args.output is None:
+        parser.error('--text and --output are required unless --serve is given')
+
     # Validate input text
     if not args.text.strip():
         logger.error("Input text cannot be empty")
         return
 
     try:
-        # Validate output path security
-        validate_output_path(args.output)
-
-        # Detect the best backend
-        backend = detect_backend()
-
-        if backend == "mlx":
-            generate_with_mlx(
-                text=args.text,
-                output_path=args.output,
-                ref_audio=args.reference_audio
-            )
-        else:
-            # Use PyTorch for cuda, mps, or cpu
-            generate_with_pytorch(
-                text=args.text,
-                output_path=args.output,
-                ref_audio=args.reference_audio,
-                device=backend
-            )
-
+        synthesize(args.text, args.output, ref_audio=args.reference_audio)
         logger.info('TTS synthesis completed successfully')
 
     except Exception as e:
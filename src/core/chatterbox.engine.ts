@@ -4,6 +4,7 @@ import * as path from "path";
 import * as os from "os";
 import { logger } from "../utils/logger";
 import { ITTSEngine, TTSOptions, TTSEngineStatus } from "./tts-engine.interface";
+import { PythonWorker, WorkerResponse, isPersistentWorkerEnabled } from "./python-worker";
 
 export class ChatterboxEngine implements ITTSEngine {
   readonly engineName = "chatterbox";
@@ -12,6 +13,7 @@ export class ChatterboxEngine implements ITTSEngine {
   private scriptPath: string;
   private bundledReferenceAudioPath: string;
   private envReady: boolean = false;
+  private worker: PythonWorker | null = null;
 
   constructor() {
     this.pythonPath = this.resolvePythonPath();
@@ -69,9 +71,12 @@ export class ChatterboxEngine implements ITTSEngine {
   }
 
   async shutdown(): Promise<void> {
-    // No resources to clean up for Chatterbox
     this.envReady = false;
-    return Promise.resolve();
+    const worker = this.worker;
+    this.worker = null;
+    if (worker) {
+      await worker.shutdown();
+    }
   }
 
   /**
@@ -285,12 +290,42 @@ export class ChatterboxEngine implements ITTSEngine {
       }
     }
 
+    const sanitizedText = this.sanitizeArg(text);
+
+    if (isPersistentWorkerEnabled()) {
+      let response: WorkerResponse | null = null;
+      try {
+        response = await this.getWorker().request({
+          text: sanitizedText,
+          output: outputFile,
+          ...(validatedReferenceAudio
+            ? { reference_audio: validatedReferenceAudio }
+            : {}),
+        });
+      } catch (error) {
+        logger.warn(
+          `TTS worker unavailable (${
+            error instanceof Error ? error.message : "Unknown error"
+          }), falling back to one-shot process`
+        );
+      }
+
+      if (response) {
+        if (response.ok && fs.existsSync(outputFile)) {
+          logger.log("TTS synthesis completed successfully via worker");
+          return outputFile;
+        }
+        logger.error("TTS worker synthesis failed:", response.error);
+        throw new Error("TTS synthesis failed");
+      }
+    }
+
     // Prepare arguments for the Python script
     // Note: Chatterbox Turbo uses paralinguistic tags in text instead of exaggeration/cfg_weight
     const args = [
       this.scriptPath,
       "--text",
-      this.sanitizeArg(text),
+      sanitizedText,
       "--output",
       outputFile,
     ];
@@ -300,6 +335,21 @@ export class ChatterboxEngine implements ITTSEngine {
       args.push("--reference_audio", validatedReferenceAudio);
     }
 
+    return this.runOneShot(args, outputFile);
+  }
+
+  private getWorker(): PythonWorker {
+    if (!this.worker) {
+      this.worker = new PythonWorker(
+        this.pythonPath,
+        [this.scriptPath],
+        "[ChatterboxEngine]"
+      );
+    }
+    return this.worker;
+  }
+
+  private runOneShot(args: string[], outputFile: string): Promise<string> {
     logger.log("Python path:", this.pythonPath);
     logger.log("Script path:", this.scriptPath);
     logger.log("Arguments:", args);
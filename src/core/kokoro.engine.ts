@@ -13,6 +13,7 @@ import * as https from "https";
 import { logger } from "../utils/logger";
 import { ITTSEngine, TTSOptions, TTSEngineStatus } from "./tts-engine.interface";
 import { KOKORO_DEFAULTS, KOKORO_LIMITS, COMMON_CONSTANTS } from "./tts-constants";
+import { PythonWorker, WorkerResponse, isPersistentWorkerEnabled } from "./python-worker";
 
 export class KokoroEngine implements ITTSEngine {
   readonly engineName = "kokoro";
@@ -21,6 +22,8 @@ export class KokoroEngine implements ITTSEngine {
   private scriptPath: string;
   private envReady: boolean = false;
   private readyPromise: Promise<void> | null = null;
+  // Persistent workers keyed by model/voices file pair, least recently used first
+  private workers = new Map<string, PythonWorker>();
 
   constructor() {
     this.pythonPath = this.resolvePythonPath();
@@ -322,6 +325,36 @@ export class KokoroEngine implements ITTSEngine {
 
     const outputFile = path.join(outputDir, `kokoro-tts-${Date.now()}.wav`);
 
+    if (isPersistentWorkerEnabled()) {
+      let response: WorkerResponse | null = null;
+      try {
+        response = await this.getWorker(modelPath, voicesPath).request({
+          text,
+          output: outputFile,
+          speed,
+          lang: language,
+          voice,
+        });
+      } catch (error) {
+        logger.warn(
+          `[KokoroEngine] Persistent worker unavailable (${
+            error instanceof Error ? error.message : "Unknown error"
+          }), falling back to one-shot process`
+        );
+      }
+
+      if (response) {
+        if (response.ok && fs.existsSync(outputFile)) {
+          logger.log(
+            `[KokoroEngine] Synthesis completed successfully (${response.duration?.toFixed(2)}s of audio)`
+          );
+          return outputFile;
+        }
+        logger.error("[KokoroEngine] Worker synthesis failed:", response.error);
+        throw new Error("Kokoro synthesis failed");
+      }
+    }
+
     const args = [
       this.scriptPath,
       "--text",
@@ -340,6 +373,37 @@ export class KokoroEngine implements ITTSEngine {
       voicesPath,
     ];
 
+    return this.runOneShot(args, outputFile);
+  }
+
+  private getWorker(modelPath: string, voicesPath: string): PythonWorker {
+    const key = `${modelPath}\0${voicesPath}`;
+    let worker = this.workers.get(key);
+    if (worker) {
+      // Re-insert to mark it most recently used
+      this.workers.delete(key);
+    } else {
+      // Callers can pick model/voices paths per request; cap the resident
+      // workers by stopping the least recently used one
+      while (this.workers.size >= KOKORO_LIMITS.MAX_WORKERS) {
+        const [oldestKey, oldest] = this.workers.entries().next().value!;
+        this.workers.delete(oldestKey);
+        logger.log("[KokoroEngine] Stopping least recently used worker");
+        oldest.shutdown().catch((error) => {
+          logger.warn("[KokoroEngine] Failed to stop worker:", error);
+        });
+      }
+      worker = new PythonWorker(
+        this.pythonPath,
+        [this.scriptPath, "--model", modelPath, "--voices", voicesPath],
+        "[KokoroEngine]"
+      );
+    }
+    this.workers.set(key, worker);
+    return worker;
+  }
+
+  private runOneShot(args: string[], outputFile: string): Promise<string> {
     logger.log("[KokoroEngine] Python path:", this.pythonPath);
     logger.log("[KokoroEngine] Script path:", this.scriptPath);
     logger.log("[KokoroEngine] Arguments:", args);
@@ -438,7 +502,9 @@ export class KokoroEngine implements ITTSEngine {
   async shutdown(): Promise<void> {
     this.envReady = false;
     this.readyPromise = null;
-    return Promise.resolve();
+    const workers = Array.from(this.workers.values());
+    this.workers.clear();
+    await Promise.all(workers.map((worker) => worker.shutdown()));
   }
 }
 
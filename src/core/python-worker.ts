@@ -0,0 +1,203 @@
+/**
+ * Persistent Python Worker
+ *
+ * Keeps a TTS runner script alive in `--serve` mode so its model is loaded
+ * once, and exchanges newline-delimited JSON requests/responses with it over
+ * stdin/stdout. Requests are matched to responses by id, so several can be
+ * in flight at once. If the worker exits, pending requests are rejected and
+ * the next request starts a fresh worker.
+ */
+
+import { spawn, ChildProcess } from "child_process";
+import * as readline from "readline";
+import { logger } from "../utils/logger";
+
+export interface WorkerResponse {
+  id?: number;
+  ok: boolean;
+  output?: string;
+  duration?: number;
+  error?: string;
+}
+
+interface PendingRequest {
+  resolve: (response: WorkerResponse) => void;
+  reject: (error: Error) => void;
+}
+
+/**
+ * Whether engines should use persistent workers instead of one-shot processes
+ */
+export function isPersistentWorkerEnabled(): boolean {
+  return process.env.TTS_PERSISTENT_WORKER?.toLowerCase() !== "false";
+}
+
+export class PythonWorker {
+  private childProcess: ChildProcess | null = null;
+  private readyPromise: Promise<void> | null = null;
+  private pending = new Map<number, PendingRequest>();
+  private nextId = 1;
+
+  /**
+   * @param pythonPath - Python interpreter to run
+   * @param args - Script path and arguments; `--serve` is appended
+   * @param logPrefix - Prefix for log lines, e.g. "[KokoroEngine]"
+   */
+  constructor(
+    private readonly pythonPath: string,
+    private readonly args: string[],
+    private readonly logPrefix: string
+  ) {}
+
+  /**
+   * Send a request to the worker, starting it first if needed.
+   * Resolves with the worker's response (which may have ok: false);
+   * rejects only if the worker could not be started or exited.
+   */
+  async request(payload: Record<string, unknown>): Promise<WorkerResponse> {
+    await this.start();
+
+    const child = this.childProcess;
+    if (!child || !child.stdin) {
+      throw new Error("Python worker is not running");
+    }
+
+    const id = this.nextId++;
+    return new Promise<WorkerResponse>((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      child.stdin!.write(JSON.stringify({ ...payload, id }) + "\n");
+    });
+  }
+
+  /**
+   * Whether the worker process is currently running
+   */
+  isRunning(): boolean {
+    return this.childProcess !== null;
+  }
+
+  /**
+   * Stop the worker and reject any pending requests
+   */
+  async shutdown(): Promise<void> {
+    const child = this.childProcess;
+    if (!child) {
+      return;
+    }
+    this.handleExit(new Error("Python worker shut down"));
+    child.stdin?.end();
+    child.kill();
+  }
+
+  private start(): Promise<void> {
+    if (this.readyPromise) {
+      return this.readyPromise;
+    }
+
+    this.readyPromise = new Promise<void>((resolve, reject) => {
+      const args = [...this.args, "--serve"];
+      logger.log(`${this.logPrefix} Starting persistent worker:`, args);
+
+      // Requests carry arbitrary text; without this Python decodes the stdin
+      // pipe with the locale encoding (cp1252 on Windows)
+      const child = spawn(this.pythonPath, args, {
+        env: { ...process.env, PYTHONIOENCODING: "utf-8" },
+      });
+      this.childProcess = child;
+
+      if (child.stdout) {
+        readline.createInterface({ input: child.stdout }).on("line", (line) => {
+          this.handleLine(line, () => resolve());
+        });
+      }
+
+      // Writing to a worker that has just died raises EPIPE on stdin; without
+      // a listener that error would crash the server
+      if (child.stdin) {
+        child.stdin.on("error", (error) => {
+          logger.error(`${this.logPrefix} worker stdin error:`, error);
+          reject(error);
+          this.handleExit(error, child);
+        });
+      }
+
+      if (child.stderr) {
+        child.stderr.on("data", (data) => {
+          logger.log(`${this.logPrefix} worker stderr:`, data.toString().trim());
+        });
+      }
+
+      child.on("error", (error) => {
+        logger.error(`${this.logPrefix} worker process error:`, error);
+        reject(error);
+        this.handleExit(error, child);
+      });
+
+      child.on("close", (code) => {
+        const error = new Error(`Python worker exited with code ${code}`);
+        logger.log(`${this.logPrefix} ${error.message}`);
+        reject(error);
+        this.handleExit(error, child);
+      });
+    }).catch((error) => {
+      // Clear the cached promise on failure so retry is possible
+      this.readyPromise = null;
+      throw error;
+    });
+
+    return this.readyPromise;
+  }
+
+  private handleLine(line: string, onReady: () => void): void {
+    let message: any;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      logger.log(`${this.logPrefix} worker stdout:`, line);
+      return;
+    }
+
+    if (message && message.ready === true) {
+      logger.log(`${this.logPrefix} Persistent worker ready`);
+      onReady();
+      return;
+    }
+
+    const entry =
+      message && typeof message.id === "number"
+        ? this.pending.get(message.id)
+        : undefined;
+    if (!entry) {
+      if (message && message.ok === false && typeof message.id !== "number") {
+        // The worker couldn't read the request's id, so it can't say which
+        // request failed; fail the pending ones rather than leave them hanging
+        logger.error(`${this.logPrefix} Worker rejected a request:`, message.error);
+        this.rejectPending(
+          new Error(message.error || "Python worker rejected a request")
+        );
+        return;
+      }
+      logger.warn(`${this.logPrefix} Unmatched worker response:`, message);
+      return;
+    }
+    this.pending.delete(message.id);
+    entry.resolve(message as WorkerResponse);
+  }
+
+  private handleExit(error: Error, child?: ChildProcess): void {
+    // Ignore late events from a worker that has already been replaced
+    if (child && child !== this.childProcess) {
+      return;
+    }
+    this.childProcess = null;
+    this.readyPromise = null;
+    this.rejectPending(error);
+  }
+
+  private rejectPending(error: Error): void {
+    for (const entry of this.pending.values()) {
+      entry.reject(error);
+    }
+    this.pending.clear();
+  }
+}
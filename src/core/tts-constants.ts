@@ -56,4 +56,6 @@ export const KOKORO_DEFAULTS = {
 export const KOKORO_LIMITS = {
   SPEED_MIN: 0.5,
   SPEED_MAX: 2.0,
+  // Persistent workers kept alive at once, one per model/voices file pair
+  MAX_WORKERS: 2,
 } as const;
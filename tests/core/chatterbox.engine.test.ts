@@ -0,0 +1,90 @@
+// Mock child_process to avoid actual Python execution in tests
+jest.mock("child_process", () => ({
+  spawn: jest.fn(),
+}));
+
+// Mock fs operations
+jest.mock("fs", () => ({
+  ...jest.requireActual("fs"),
+  existsSync: jest.fn(),
+  mkdirSync: jest.fn(),
+}));
+
+import fs from "fs";
+import { ChatterboxEngine } from "../../src/core/chatterbox.engine";
+import {
+  createFailingChild,
+  createOneShotChild,
+  createWorkerChild,
+} from "../helpers/fake-child";
+
+const mockFs = fs as jest.Mocked<typeof fs>;
+const mockSpawn = require("child_process").spawn;
+
+describe("ChatterboxEngine synthesis", () => {
+  const originalEnv = process.env.TTS_PERSISTENT_WORKER;
+  let engine: ChatterboxEngine;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    delete process.env.TTS_PERSISTENT_WORKER;
+    mockFs.existsSync.mockReturnValue(true);
+    mockFs.mkdirSync.mockReturnValue(undefined);
+
+    engine = new ChatterboxEngine();
+  });
+
+  afterEach(async () => {
+    await engine.shutdown();
+    if (originalEnv === undefined) {
+      delete process.env.TTS_PERSISTENT_WORKER;
+    } else {
+      process.env.TTS_PERSISTENT_WORKER = originalEnv;
+    }
+  });
+
+  it("should synthesize through the persistent worker", async () => {
+    mockSpawn.mockReturnValue(createWorkerChild());
+
+    const output = await engine.synthesize("Hello world", {});
+
+    expect(output).toMatch(/tts-\d+\.wav$/);
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+    expect(mockSpawn.mock.calls[0][1]).toContain("--serve");
+  });
+
+  it("should throw without falling back when the worker reports a failure", async () => {
+    mockSpawn.mockReturnValue(createWorkerChild({ error: "Invalid output path" }));
+
+    await expect(engine.synthesize("Hello world", {})).rejects.toThrow(
+      "TTS synthesis failed"
+    );
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+  });
+
+  it("should fall back to a one-shot process when the worker cannot start", async () => {
+    mockSpawn
+      .mockReturnValueOnce(createFailingChild())
+      .mockReturnValueOnce(createOneShotChild());
+
+    const output = await engine.synthesize("Hello world", {});
+
+    expect(output).toMatch(/tts-\d+\.wav$/);
+    expect(mockSpawn).toHaveBeenCalledTimes(2);
+    const oneShotArgs = mockSpawn.mock.calls[1][1];
+    expect(oneShotArgs).toContain("--text");
+    expect(oneShotArgs).not.toContain("--serve");
+  });
+
+  it("should use a one-shot process when TTS_PERSISTENT_WORKER is false", async () => {
+    process.env.TTS_PERSISTENT_WORKER = "false";
+    mockSpawn.mockReturnValue(createOneShotChild());
+
+    await engine.synthesize("Hello world", {});
+
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+    const args = mockSpawn.mock.calls[0][1];
+    expect(args).toContain("--text");
+    expect(args).not.toContain("--serve");
+  });
+});
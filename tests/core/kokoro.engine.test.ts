@@ -0,0 +1,110 @@
+// Mock child_process to avoid actual Python execution in tests
+jest.mock("child_process", () => ({
+  spawn: jest.fn(),
+}));
+
+// Mock fs operations
+jest.mock("fs", () => ({
+  ...jest.requireActual("fs"),
+  existsSync: jest.fn(),
+  mkdirSync: jest.fn(),
+}));
+
+import fs from "fs";
+import { KokoroEngine } from "../../src/core/kokoro.engine";
+import {
+  createFailingChild,
+  createOneShotChild,
+  createWorkerChild,
+} from "../helpers/fake-child";
+
+const mockFs = fs as jest.Mocked<typeof fs>;
+const mockSpawn = require("child_process").spawn;
+
+describe("KokoroEngine synthesis", () => {
+  const originalEnv = process.env.TTS_PERSISTENT_WORKER;
+  let engine: KokoroEngine;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    delete process.env.TTS_PERSISTENT_WORKER;
+    mockFs.existsSync.mockReturnValue(true);
+    mockFs.mkdirSync.mockReturnValue(undefined);
+
+    engine = new KokoroEngine();
+    // Skip model download and dependency checks
+    (engine as any).envReady = true;
+  });
+
+  afterEach(async () => {
+    await engine.shutdown();
+    if (originalEnv === undefined) {
+      delete process.env.TTS_PERSISTENT_WORKER;
+    } else {
+      process.env.TTS_PERSISTENT_WORKER = originalEnv;
+    }
+  });
+
+  it("should synthesize through the persistent worker", async () => {
+    mockSpawn.mockReturnValue(createWorkerChild());
+
+    const output = await engine.synthesize("Hello world", {});
+
+    expect(output).toMatch(/kokoro-tts-\d+\.wav$/);
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+    expect(mockSpawn.mock.calls[0][1]).toContain("--serve");
+  });
+
+  it("should throw without falling back when the worker reports a failure", async () => {
+    mockSpawn.mockReturnValue(createWorkerChild({ error: "Voice not found" }));
+
+    await expect(engine.synthesize("Hello world", {})).rejects.toThrow(
+      "Kokoro synthesis failed"
+    );
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+  });
+
+  it("should fall back to a one-shot process when the worker cannot start", async () => {
+    mockSpawn
+      .mockReturnValueOnce(createFailingChild())
+      .mockReturnValueOnce(createOneShotChild());
+
+    const output = await engine.synthesize("Hello world", {});
+
+    expect(output).toMatch(/kokoro-tts-\d+\.wav$/);
+    expect(mockSpawn).toHaveBeenCalledTimes(2);
+    const oneShotArgs = mockSpawn.mock.calls[1][1];
+    expect(oneShotArgs).toContain("--text");
+    expect(oneShotArgs).not.toContain("--serve");
+  });
+
+  it("should stop the least recently used worker beyond the cap", async () => {
+    const children: any[] = [
+      createWorkerChild(),
+      createWorkerChild(),
+      createWorkerChild(),
+    ];
+    children.forEach((child) => mockSpawn.mockReturnValueOnce(child));
+
+    await engine.synthesize("one", { model_path: "/models/a.onnx" });
+    await engine.synthesize("two", { model_path: "/models/b.onnx" });
+    await engine.synthesize("three", { model_path: "/models/c.onnx" });
+
+    expect(mockSpawn).toHaveBeenCalledTimes(3);
+    expect(children[0].kill).toHaveBeenCalled();
+    expect(children[1].kill).not.toHaveBeenCalled();
+    expect(children[2].kill).not.toHaveBeenCalled();
+  });
+
+  it("should use a one-shot process when TTS_PERSISTENT_WORKER is false", async () => {
+    process.env.TTS_PERSISTENT_WORKER = "false";
+    mockSpawn.mockReturnValue(createOneShotChild());
+
+    await engine.synthesize("Hello world", {});
+
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+    const args = mockSpawn.mock.calls[0][1];
+    expect(args).toContain("--text");
+    expect(args).not.toContain("--serve");
+  });
+});
@@ -0,0 +1,138 @@
+// Mock child_process to avoid actual Python execution in tests
+jest.mock("child_process", () => ({
+  spawn: jest.fn(),
+}));
+
+import {
+  PythonWorker,
+  isPersistentWorkerEnabled,
+} from "../../src/core/python-worker";
+import { createWorkerChild } from "../helpers/fake-child";
+
+const mockSpawn = require("child_process").spawn;
+
+describe("PythonWorker", () => {
+  const originalEnv = process.env.TTS_PERSISTENT_WORKER;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  afterEach(() => {
+    if (originalEnv === undefined) {
+      delete process.env.TTS_PERSISTENT_WORKER;
+    } else {
+      process.env.TTS_PERSISTENT_WORKER = originalEnv;
+    }
+  });
+
+  it("should be enabled unless TTS_PERSISTENT_WORKER is false", () => {
+    delete process.env.TTS_PERSISTENT_WORKER;
+    expect(isPersistentWorkerEnabled()).toBe(true);
+
+    process.env.TTS_PERSISTENT_WORKER = "false";
+    expect(isPersistentWorkerEnabled()).toBe(false);
+  });
+
+  it("should start the script in serve mode once and reuse it", async () => {
+    const child = createWorkerChild();
+    mockSpawn.mockReturnValue(child);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    const first = await worker.request({ text: "one", output: "/tmp/a.wav" });
+    const second = await worker.request({ text: "two", output: "/tmp/b.wav" });
+
+    expect(mockSpawn).toHaveBeenCalledTimes(1);
+    expect(mockSpawn).toHaveBeenCalledWith(
+      "python3",
+      ["runner.py", "--serve"],
+      expect.objectContaining({
+        env: expect.objectContaining({ PYTHONIOENCODING: "utf-8" }),
+      })
+    );
+    expect(first).toMatchObject({ ok: true, output: "/tmp/a.wav" });
+    expect(second).toMatchObject({ ok: true, output: "/tmp/b.wav" });
+    expect(child.requests.map((request) => request.text)).toEqual([
+      "one",
+      "two",
+    ]);
+    expect(worker.isRunning()).toBe(true);
+  });
+
+  it("should reject when the worker exits before becoming ready", async () => {
+    const child = createWorkerChild({ ready: false });
+    mockSpawn.mockReturnValue(child);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    const pending = worker.request({ text: "hello", output: "/tmp/a.wav" });
+    child.emit("close", 1);
+
+    await expect(pending).rejects.toThrow("Python worker exited with code 1");
+    expect(worker.isRunning()).toBe(false);
+  });
+
+  it("should reject pending requests when writing to stdin fails", async () => {
+    const child = createWorkerChild();
+    // Simulate a worker that died after reporting ready: the write fails with EPIPE
+    (child.stdin as any).write = jest.fn(() => {
+      setImmediate(() =>
+        child.stdin.emit(
+          "error",
+          Object.assign(new Error("write EPIPE"), { code: "EPIPE" })
+        )
+      );
+      return false;
+    });
+    mockSpawn.mockReturnValue(child);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    const pending = worker.request({ text: "hello", output: "/tmp/a.wav" });
+
+    await expect(pending).rejects.toThrow("write EPIPE");
+    expect(worker.isRunning()).toBe(false);
+  });
+
+  it("should reject pending requests on a failure reply without an id", async () => {
+    const child = createWorkerChild();
+    child.stdin.removeAllListeners("data");
+    child.stdin.on("data", () => {
+      child.stdout.write(
+        JSON.stringify({ ok: false, error: "Invalid JSON request" }) + "\n"
+      );
+    });
+    mockSpawn.mockReturnValue(child);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    const pending = worker.request({ text: "hello", output: "/tmp/a.wav" });
+
+    await expect(pending).rejects.toThrow("Invalid JSON request");
+    expect(worker.isRunning()).toBe(true);
+  });
+
+  it("should restart the worker after it exits", async () => {
+    const first = createWorkerChild();
+    const second = createWorkerChild();
+    mockSpawn.mockReturnValueOnce(first).mockReturnValueOnce(second);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    await worker.request({ text: "one", output: "/tmp/a.wav" });
+    first.emit("close", 0);
+
+    const response = await worker.request({ text: "two", output: "/tmp/b.wav" });
+    expect(mockSpawn).toHaveBeenCalledTimes(2);
+    expect(response.ok).toBe(true);
+    expect(second.requests).toHaveLength(1);
+  });
+
+  it("should kill the process on shutdown", async () => {
+    const child = createWorkerChild();
+    mockSpawn.mockReturnValue(child);
+
+    const worker = new PythonWorker("python3", ["runner.py"], "[Test]");
+    await worker.request({ text: "one", output: "/tmp/a.wav" });
+    await worker.shutdown();
+
+    expect(child.kill).toHaveBeenCalled();
+    expect(worker.isRunning()).toBe(false);
+  });
+});
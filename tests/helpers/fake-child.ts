@@ -0,0 +1,75 @@
+/**
+ * Fake child processes for tests that mock `child_process.spawn`
+ */
+
+import { EventEmitter } from "events";
+import { PassThrough } from "stream";
+
+export interface FakeChild extends EventEmitter {
+  stdin: PassThrough;
+  stdout: PassThrough;
+  stderr: PassThrough;
+  kill: jest.Mock;
+  requests: any[];
+}
+
+export interface WorkerChildOptions {
+  /** Report ready on startup (default: true) */
+  ready?: boolean;
+  /** Answer every request with ok: false and this error instead of ok: true */
+  error?: string;
+}
+
+/**
+ * Fake persistent worker that reports ready and answers each request it
+ * receives, recording the requests in `requests`
+ */
+export function createWorkerChild(
+  { ready = true, error }: WorkerChildOptions = {}
+): FakeChild {
+  const child = new EventEmitter() as FakeChild;
+  child.stdin = new PassThrough();
+  child.stdout = new PassThrough();
+  child.stderr = new PassThrough();
+  child.kill = jest.fn();
+  child.requests = [];
+
+  child.stdin.on("data", (data: Buffer) => {
+    for (const line of data.toString().split("\n").filter(Boolean)) {
+      const request = JSON.parse(line);
+      child.requests.push(request);
+      const response = error
+        ? { id: request.id, ok: false, error }
+        : { id: request.id, ok: true, output: request.output, duration: 1.5 };
+      child.stdout.write(JSON.stringify(response) + "\n");
+    }
+  });
+
+  if (ready) {
+    setImmediate(() => child.stdout.write('{"ready": true}\n'));
+  }
+  return child;
+}
+
+/**
+ * Fake process that fails to start, as when the interpreter is missing
+ */
+export function createFailingChild(): EventEmitter {
+  const child: any = new EventEmitter();
+  child.stdin = new PassThrough();
+  child.stdout = new PassThrough();
+  child.stderr = new PassThrough();
+  setImmediate(() => child.emit("error", new Error("spawn python3 ENOENT")));
+  return child;
+}
+
+/**
+ * Fake one-shot runner process that exits with the given code
+ */
+export function createOneShotChild(code = 0): EventEmitter {
+  const child: any = new EventEmitter();
+  child.stdout = new PassThrough();
+  child.stderr = new PassThrough();
+  setImmediate(() => child.emit("close", code));
+  return child;
+}
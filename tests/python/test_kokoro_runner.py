@@ -0,0 +1,83 @@
+"""Round-trip checks for the binary formats kokoro_runner.py writes and parses by hand.
+
+Run with: python -m unittest discover tests/python (needs numpy and soundfile)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "scripts"))
+
+import kokoro_runner  # noqa: E402
+
+try:
+    import numpy as np
+    import soundfile as sf
+except ImportError:
+    np = sf = None
+
+
+@unittest.skipIf(np is None, "numpy and soundfile are required")
+class KokoroRunnerTestCase(unittest.TestCase):
+    def setUp(self):
+        # import_dependencies() would also require kokoro-onnx
+        kokoro_runner.np = np
+        kokoro_runner.sf = sf
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+
+class Pcm16WavWriterTest(KokoroRunnerTestCase):
+    def test_round_trips_through_soundfile(self):
+        chunks = [
+            np.linspace(-1.5, 1.5, 1000, dtype=np.float32),
+            np.sin(np.arange(2400, dtype=np.float32) / 10),
+        ]
+        writer = kokoro_runner.Pcm16WavWriter(self.path("out.wav"), 24000)
+        for chunk in chunks:
+            writer.write(chunk)
+        writer.close()
+
+        info = sf.info(self.path("out.wav"))
+        self.assertEqual(info.samplerate, 24000)
+        self.assertEqual(info.channels, 1)
+        self.assertEqual(info.subtype, "PCM_16")
+        self.assertEqual(info.frames, 3400)
+
+        data, samplerate = sf.read(self.path("out.wav"), dtype="int16")
+        expected = (np.clip(np.concatenate(chunks), -1.0, 1.0) * 32767).astype(np.int16)
+        self.assertEqual(samplerate, 24000)
+        np.testing.assert_array_equal(data, expected)
+
+
+class MmapVoicesTest(KokoroRunnerTestCase):
+    def test_matches_np_load(self):
+        rng = np.random.default_rng(0)
+        arrays = {
+            "af_sarah": rng.standard_normal((510, 1, 256), dtype=np.float32),
+            "am_adam": rng.standard_normal((510, 1, 256), dtype=np.float32),
+            "fortran": np.asfortranarray(rng.standard_normal((4, 3))),
+        }
+        np.savez(self.path("voices.npz"), **arrays)
+
+        voices = kokoro_runner.mmap_voices(self.path("voices.npz"))
+
+        with np.load(self.path("voices.npz")) as expected:
+            self.assertEqual(set(voices), set(expected.files))
+            for name in expected.files:
+                self.assertEqual(voices[name].dtype, expected[name].dtype)
+                np.testing.assert_array_equal(voices[name], expected[name])
+
+    def test_compressed_archive_is_not_mapped(self):
+        np.savez_compressed(self.path("voices.npz"), af_sarah=np.zeros((2, 2), np.float32))
+
+        self.assertIsNone(kokoro_runner.mmap_voices(self.path("voices.npz")))
+
+
+if __name__ == "__main__":
+    unittest.main()